@@ -59,7 +59,7 @@ from plumbum import cli, colors
 
 from .errors import UnsafeTemplateError, UserMessageError
 from .main import Worker
-from .tools import copier_version
+from .tools import YamlSafeLoader, copier_version
 from .types import AnyByStrDict
 
 
@@ -190,7 +190,7 @@ class _Subcommand(cli.Application):  # type: ignore[misc]
             path: The path to the YAML file to load.
         """
         with open(path) as f:
-            file_updates: AnyByStrDict = yaml.safe_load(f)
+            file_updates: AnyByStrDict = yaml.load(f, Loader=YamlSafeLoader)
 
         updates_without_cli_overrides = {
             k: v for k, v in file_updates.items() if k not in self.data
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Callable, Iterable
 
-from jinja2 import nodes
+from jinja2 import Environment, Template, nodes
 from jinja2.exceptions import UndefinedError
 from jinja2.ext import Extension
 from jinja2.parser import Parser
@@ -26,10 +26,11 @@ class YieldEnvironment(SandboxedEnvironment):
 
     yield_name: str | None
     yield_iterable: Iterable[Any] | None
+    compiled_templates: dict[str, Template]
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self.extend(yield_name=None, yield_iterable=None)
+        self.extend(yield_name=None, yield_iterable=None, compiled_templates={})
 
 
 class YieldExtension(Extension):
@@ -121,3 +122,60 @@ class YieldExtension(Extension):
             res = ""
 
         return res
+
+
+def compile_template(env: Environment, source: str) -> Template:
+    """Compile a template string, reusing previous compilations in the same environment.
+
+    Question values and path parts repeat the same strings over and over, so
+    each one is parsed and compiled only once per environment.
+    """
+    # Other extensions may rely on preprocessing every compilation
+    if not isinstance(env, YieldEnvironment) or _has_custom_preprocess(env):
+        return env.from_string(source)
+    try:
+        template = env.compiled_templates[source]
+    except KeyError:
+        template = env.compiled_templates[source] = env.from_string(source)
+    else:
+        # Compiling resets these through `YieldExtension.preprocess`, but a
+        # cached template skips that step
+        env.yield_name = env.yield_iterable = None
+    return template
+
+
+def is_verbatim(env: Environment, source: str) -> bool:
+    """Tell if a template string would render as itself in the given environment.
+
+    Most question values and path parts are literals, and those don't need
+    Jinja at all.
+    """
+    if (
+        env.variable_start_string in source
+        or env.block_start_string in source
+        or env.comment_start_string in source
+        or env.line_statement_prefix is not None
+        or env.line_comment_prefix is not None
+        or "\r" in source
+    ):
+        return False
+    # Jinja normalizes newlines and may strip a trailing one
+    if "\n" in source and (
+        env.newline_sequence != "\n"
+        or (source.endswith("\n") and not env.keep_trailing_newline)
+    ):
+        return False
+    # Extensions may rewrite the source before it is parsed
+    return not _has_custom_preprocess(env) and all(
+        type(ext).filter_stream is Extension.filter_stream
+        for ext in env.extensions.values()
+    )
+
+
+def _has_custom_preprocess(env: Environment) -> bool:
+    """Tell if an extension other than `YieldExtension` preprocesses sources."""
+    return any(
+        not isinstance(ext, YieldExtension)
+        and type(ext).preprocess is not Extension.preprocess
+        for ext in env.extensions.values()
+    )
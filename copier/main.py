@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import os
-import platform
 import subprocess
 import sys
 from contextlib import suppress
-from dataclasses import asdict, field, replace
+from copy import copy
+from dataclasses import asdict, field, fields, replace
 from filecmp import dircmp
-from functools import cached_property, partial
+from functools import cached_property, lru_cache, partial
 from itertools import chain
 from pathlib import Path
-from shutil import rmtree
+from shutil import copyfile, rmtree
 from tempfile import TemporaryDirectory
 from types import TracebackType
 from typing import (
@@ -45,7 +45,12 @@ from .errors import (
     UserMessageError,
     YieldTagInFileError,
 )
-from .jinja_ext import YieldEnvironment, YieldExtension
+from .jinja_ext import (
+    YieldEnvironment,
+    YieldExtension,
+    compile_template,
+    is_verbatim,
+)
 from .subproject import Subproject
 from .template import Task, Template
 from .tools import (
@@ -53,6 +58,7 @@ from .tools import (
     Style,
     cast_to_bool,
     escape_git_path,
+    file_contents_equal,
     normalize_git_path,
     printf,
     scantree,
@@ -63,6 +69,7 @@ from .types import (
     AnyByStrDict,
     JSONSerializable,
     RelativePath,
+    RenderedParentsCache,
     StrOrPath,
 )
 from .user_data import DEFAULT_DATA, AnswersMap, Question
@@ -278,13 +285,16 @@ class Worker:
             if value is not None:
                 answers[key] = value
         # Other data goes next
+        hidden = self.answers.hidden
+        secret_questions = self.template.secret_questions
+        questions_data = self.template.questions_data
         answers.update(
             (str(k), v)
             for (k, v) in self.answers.combined.items()
             if not k.startswith("_")
-            and k not in self.answers.hidden
-            and k not in self.template.secret_questions
-            and k in self.template.questions_data
+            and k not in hidden
+            and k not in secret_questions
+            and k in questions_data
             and isinstance(k, JSONSerializable)
             and isinstance(v, JSONSerializable)
         )
@@ -331,14 +341,51 @@ class Worker:
             with local.cwd(working_directory), local.env(**extra_env):
                 subprocess.run(task_cmd, shell=use_shell, check=True, env=local.env)
 
+    @property
     def _render_context(self) -> Mapping[str, Any]:
-        """Produce render context for Jinja."""
+        """Produce render context for Jinja.
+
+        It is built once for the current answers, and again whenever
+        `answers` is replaced. Each render still gets its own copies of the
+        containers templates could change, so changes never leak into
+        other renders.
+        """
+        context: Mapping[str, Any]
+        try:
+            answers, context = self.__dict__["_render_context_cache"]
+        except KeyError:
+            answers = None
+        if answers is not self.answers:
+            context = self._build_render_context()
+            self.__dict__["_render_context_cache"] = self.answers, context
+        conf = context["_copier_conf"]
+        return {
+            **context,
+            "_copier_answers": dict(context["_copier_answers"]),
+            "_copier_conf": {
+                **conf,
+                "answers": {key: copy(value) for key, value in conf["answers"].items()},
+                "data": dict(conf["data"]),
+                "exclude": copy(conf["exclude"]),
+                "skip_if_exists": copy(conf["skip_if_exists"]),
+                "user_defaults": dict(conf["user_defaults"]),
+            },
+        }
+
+    def _build_render_context(self) -> Mapping[str, Any]:
+        """Build the render context for Jinja from scratch."""
         # Backwards compatibility
         # FIXME Remove it?
-        conf = asdict(self)
-        conf.pop("_cleanup_hooks")
+        conf = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name != "_cleanup_hooks"
+        }
+        # asdict() would recursively copy every field; containers are copied
+        # for each render instead
         conf.update(
             {
+                "answers": asdict(self.answers),
                 "answers_file": self.answers_relpath,
                 "src_path": self.template.local_abspath,
                 "vcs_ref_hash": self.template.commit_hash,
@@ -359,9 +406,14 @@ class Worker:
     def _path_matcher(self, patterns: Iterable[str]) -> Callable[[Path], bool]:
         """Produce a function that matches against specified patterns."""
         # TODO Is normalization really needed?
-        normalized_patterns = (normalize("NFD", pattern) for pattern in patterns)
-        spec = PathSpec.from_lines("gitwildmatch", normalized_patterns)
-        return spec.match_file
+        normalized_patterns = tuple(
+            pattern if pattern.isascii() else normalize("NFD", pattern)
+            for pattern in patterns
+        )
+        spec = _compile_path_spec(normalized_patterns)
+        # Every pattern is tried on each call, and some paths are checked more
+        # than once (e.g. symlinks), so remember the results
+        return lru_cache(maxsize=None)(spec.match_file)
 
     def _solve_render_conflict(self, dst_relpath: Path) -> bool:
         """Properly solve render conflicts.
@@ -414,18 +466,27 @@ class Worker:
                 Indicate if the path must be treated as a symlink or not.
             expected_contents:
                 Used to compare existing file contents with them. Allows to know if
-                rendering is needed.
+                rendering is needed. For symlinks, it is the expected target.
+                For files, it can also be the path to a file holding them, to
+                compare without loading it in memory.
         """
         assert not dst_relpath.is_absolute()
         assert not expected_contents or not is_dir, "Dirs cannot have expected content"
         dst_abspath = Path(self.subproject.local_abspath, dst_relpath)
         previous_is_symlink = dst_abspath.is_symlink()
+        identical = False
         try:
-            previous_content: bytes | Path
             if previous_is_symlink:
-                previous_content = dst_abspath.readlink()
+                identical = dst_abspath.readlink() == expected_contents and is_symlink
+            elif is_symlink:
+                # Only a symlink can be identical to a symlink, so just make
+                # sure there is something to replace
+                dst_abspath.lstat()
+            elif is_dir:
+                # Any existing path is enough; no need to fail opening it
+                dst_abspath.stat()
             else:
-                previous_content = dst_abspath.read_bytes()
+                identical = file_contents_equal(dst_abspath, expected_contents)
         except FileNotFoundError:
             printf(
                 "create",
@@ -437,13 +498,11 @@ class Worker:
             return True
         except PermissionError as error:
             # HACK https://bugs.python.org/issue43095
-            if not (error.errno == 13 and platform.system() == "Windows"):
+            if not (error.errno == 13 and OS == "windows"):
                 raise
         except IsADirectoryError:
             assert is_dir
-        if is_dir or (
-            previous_content == expected_contents and previous_is_symlink == is_symlink
-        ):
+        if is_dir or identical:
             printf(
                 "identical",
                 dst_relpath,
@@ -533,7 +592,7 @@ class Worker:
         3. Copier default.
         """
         path = self.answers_file or self.template.answers_relpath
-        template = self.jinja_env.from_string(str(path))
+        template = compile_template(self.jinja_env, str(path))
         return Path(template.render(**self.answers.combined))
 
     @cached_property
@@ -556,7 +615,14 @@ class Worker:
         extensions = default_extensions + list(self.template.jinja_extensions)
         try:
             env = YieldEnvironment(
-                loader=loader, extensions=extensions, **self.template.envops
+                loader=loader,
+                extensions=extensions,
+                **{
+                    # Sources don't change while rendering, so there is no
+                    # need to stat them again on every cached lookup
+                    "auto_reload": False,
+                    **self.template.envops,
+                },
             )
         except ModuleNotFoundError as error:
             raise ExtensionNotFoundError(
@@ -602,11 +668,13 @@ class Worker:
     def _render_template(self) -> None:
         """Render the template in the subproject root."""
         follow_symlinks = not self.template.preserve_symlinks
+        rendered_parents: RenderedParentsCache = {}
         for src in scantree(str(self.template_copy_root), follow_symlinks):
             src_abspath = Path(src.path)
             src_relpath = Path(src_abspath).relative_to(self.template.local_abspath)
             dst_relpaths_ctxs = self._render_path(
-                Path(src_abspath).relative_to(self.template_copy_root)
+                Path(src_abspath).relative_to(self.template_copy_root),
+                rendered_parents,
             )
             for dst_relpath, ctx in dst_relpaths_ctxs:
                 if self.match_exclude(dst_relpath):
@@ -640,6 +708,8 @@ class Worker:
         assert not src_relpath.is_absolute()
         assert not dst_relpath.is_absolute()
         src_abspath = self.template.local_abspath / src_relpath
+        # Raw files are copied as they are, without reading them here
+        new_content: bytes | None = None
         if src_relpath.name.endswith(self.template.templates_suffix):
             try:
                 tpl = self.jinja_env.get_template(src_relpath.as_posix())
@@ -648,20 +718,20 @@ class Worker:
                     # suffix is not empty, re-raise
                     raise
                 # suffix is empty, fallback to copy
-                new_content = src_abspath.read_bytes()
             else:
                 new_content = tpl.render(
-                    **self._render_context(), **(extra_context or {})
+                    **self._render_context, **(extra_context or {})
                 ).encode()
                 if self.jinja_env.yield_name:
                     raise YieldTagInFileError(
                         f"File {src_relpath} contains a yield tag, but it is not allowed."
                     )
-        else:
-            new_content = src_abspath.read_bytes()
         dst_abspath = self.subproject.local_abspath / dst_relpath
         src_mode = src_abspath.stat().st_mode
-        if not self._render_allowed(dst_relpath, expected_contents=new_content):
+        if not self._render_allowed(
+            dst_relpath,
+            expected_contents=src_abspath if new_content is None else new_content,
+        ):
             return
         if not self.pretend:
             dst_abspath.parent.mkdir(parents=True, exist_ok=True)
@@ -669,7 +739,10 @@ class Worker:
                 # Writing to a symlink just writes to its target, so if we want to
                 # replace a symlink with a file we have to unlink it first
                 dst_abspath.unlink()
-            dst_abspath.write_bytes(new_content)
+            if new_content is None:
+                copyfile(src_abspath, dst_abspath)
+            else:
+                dst_abspath.write_bytes(new_content)
             dst_abspath.chmod(src_mode)
 
     def _render_symlink(self, src_relpath: Path, dst_relpath: Path) -> None:
@@ -760,11 +833,9 @@ class Worker:
         if not parts:
             rendered_path = Path(*rendered_parts)
 
-            templated_sibling = (
-                self.template.local_abspath
-                / f"{rendered_path}{self.template.templates_suffix}"
-            )
-            if is_template or not templated_sibling.exists():
+            if is_template or not self._template_path_exists(
+                f"{rendered_path}{self.template.templates_suffix}"
+            ):
                 yield rendered_path, extra_context
 
             return
@@ -772,57 +843,135 @@ class Worker:
         part = parts[0]
         parts = parts[1:]
 
-        if not extra_context:
-            extra_context = {}
+        for rendered_part, context in self._render_part(part, extra_context or {}):
+            yield from self._render_parts(
+                parts, rendered_parts + (rendered_part,), context, is_template
+            )
+
+    def _render_part(
+        self, part: str, extra_context: AnyByStrDict
+    ) -> list[tuple[str, AnyByStrDict]]:
+        """Render a single path part into rendered part and context pairs.
 
+        If a yield tag is found in the part, it will produce one pair per yielded value.
+        Parts rendered as an empty string are skipped.
+        """
         # If the `part` has a yield tag, `self.jinja_env` will be set with the yield name and iterable
         rendered_part = self._render_string(part, extra_context=extra_context)
 
         yield_name = self.jinja_env.yield_name
         if yield_name:
+            result = []
             for value in self.jinja_env.yield_iterable or ():
                 new_context = {**extra_context, yield_name: value}
                 rendered_part = self._render_string(part, extra_context=new_context)
                 rendered_part = self._adjust_rendered_part(rendered_part)
 
                 # Skip if any part is rendered as an empty string
-                if not rendered_part:
-                    continue
+                if rendered_part:
+                    result.append((rendered_part, new_context))
 
-                yield from self._render_parts(
-                    parts, rendered_parts + (rendered_part,), new_context, is_template
-                )
-
-            return
+            return result
 
         # Skip if any part is rendered as an empty string
         if not rendered_part:
-            return
+            return []
 
-        rendered_part = self._adjust_rendered_part(rendered_part)
+        return [(self._adjust_rendered_part(rendered_part), extra_context)]
 
-        yield from self._render_parts(
-            parts, rendered_parts + (rendered_part,), extra_context, is_template
-        )
+    def _render_parent_parts(
+        self,
+        parts: tuple[str, ...],
+        cache: RenderedParentsCache,
+    ) -> list[tuple[tuple[str, ...], AnyByStrDict]]:
+        """Render the parts of a folder path, reusing its already rendered parents.
 
-    def _render_path(self, relpath: Path) -> Iterable[tuple[Path, AnyByStrDict | None]]:
+        Args:
+            parts:
+                The parts of the folder path to render.
+            cache:
+                Already rendered folder paths, by their parts.
+        """
+        try:
+            return cache[parts]
+        except KeyError:
+            pass
+        if not parts:
+            result: list[tuple[tuple[str, ...], AnyByStrDict]] = [((), {})]
+        else:
+            result = [
+                (rendered_parts + (rendered_part,), context)
+                for rendered_parts, parent_context in self._render_parent_parts(
+                    parts[:-1], cache
+                )
+                for rendered_part, context in self._render_part(
+                    parts[-1], parent_context
+                )
+            ]
+        cache[parts] = result
+        return result
+
+    @cached_property
+    def _template_listings(self) -> dict[Path, frozenset[str]]:
+        """Folded names in each template folder, filled as folders are looked up."""
+        return {}
+
+    def _template_path_exists(self, relpath: str) -> bool:
+        """Tell if a path exists in the template.
+
+        Each template folder is listed only once, instead of calling `stat()`
+        for every path checked in it. The listing only rules out paths that
+        cannot exist.
+
+        Args:
+            relpath:
+                Path relative to the template root.
+        """
+        path = self.template.local_abspath / relpath
+        try:
+            names = self._template_listings[path.parent]
+        except KeyError:
+            try:
+                names = frozenset(map(_fold_name, os.listdir(path.parent)))
+            except OSError:
+                names = frozenset()
+            self._template_listings[path.parent] = names
+        # Names are folded because case-insensitive or normalizing filesystems
+        # find paths spelled differently than listed. Anything left is checked
+        # on disk, as listed broken symlinks don't exist either.
+        return _fold_name(path.name) in names and path.exists()
+
+    def _render_path(
+        self,
+        relpath: Path,
+        rendered_parents: RenderedParentsCache | None = None,
+    ) -> Iterable[tuple[Path, AnyByStrDict | None]]:
         """Render one relative path into multiple path and context pairs.
 
         Args:
             relpath:
                 The relative path to be rendered. Obviously, it can be templated.
+            rendered_parents:
+                Already rendered parent folders, shared among sibling paths to
+                render each folder only once.
         """
         is_template = relpath.name.endswith(self.template.templates_suffix)
-        templated_sibling = (
-            self.template.local_abspath / f"{relpath}{self.template.templates_suffix}"
-        )
         # With an empty suffix, the templated sibling always exists.
-        if templated_sibling.exists() and self.template.templates_suffix:
+        if self.template.templates_suffix and self._template_path_exists(
+            f"{relpath}{self.template.templates_suffix}"
+        ):
             return
         if self.template.templates_suffix and is_template:
             relpath = relpath.with_suffix("")
 
-        yield from self._render_parts(relpath.parts, is_template=is_template)
+        if rendered_parents is None:
+            rendered_parents = {}
+        for rendered_parts, context in self._render_parent_parts(
+            relpath.parent.parts, rendered_parents
+        ):
+            yield from self._render_parts(
+                (relpath.name,), rendered_parts, context, is_template
+            )
 
     def _render_string(
         self, string: str, extra_context: AnyByStrDict | None = None
@@ -836,8 +985,12 @@ class Worker:
             extra_context:
                 Additional variables to use for rendering the template.
         """
-        tpl = self.jinja_env.from_string(string)
-        return tpl.render(**self._render_context(), **(extra_context or {}))
+        if is_verbatim(self.jinja_env, string):
+            # Rendering would reset these, so callers can check for yield tags
+            self.jinja_env.yield_name = self.jinja_env.yield_iterable = None
+            return string
+        tpl = compile_template(self.jinja_env, string)
+        return tpl.render(**self._render_context, **(extra_context or {}))
 
     def _render_value(
         self, value: _T, extra_context: AnyByStrDict | None = None
@@ -851,10 +1004,9 @@ class Worker:
             extra_context:
                 Additional variables to use for rendering the template.
         """
-        try:
-            return self._render_string(value, extra_context=extra_context)  # type: ignore[arg-type]
-        except TypeError:
+        if not isinstance(value, str):
             return value
+        return self._render_string(value, extra_context=extra_context)
 
     @cached_property
     def subproject(self) -> Subproject:
@@ -869,16 +1021,36 @@ class Worker:
     @cached_property
     def template(self) -> Template:
         """Get related template."""
+        result = self._template_source()
+        if result is None:
+            raise TypeError("Template not found")
+        self._cleanup_hooks.append(result._cleanup)
+        return result
+
+    def _template_source(self) -> Template | None:
+        """Describe the template to use, without cloning or reading it yet."""
         url = self.src_path
         if not url:
             if self.subproject.template is None:
-                raise TypeError("Template not found")
+                return None
             url = str(self.subproject.template.url)
-        result = Template(
-            url=url, ref=self.vcs_ref, use_prereleases=self.use_prereleases
+        return Template(url=url, ref=self.vcs_ref, use_prereleases=self.use_prereleases)
+
+    def _share_template(self, worker: Worker) -> None:
+        """Let another worker reuse this worker's template, if it is the same one.
+
+        This avoids cloning the same template again and recompiling all its
+        files. Cleaning up the template is still up to this worker.
+        """
+        if "template" not in self.__dict__:
+            return
+        if worker._template_source() != self.template:
+            return
+        worker.__dict__.update(
+            template=self.template,
+            jinja_env=self.jinja_env,
+            _template_listings=self._template_listings,
         )
-        self._cleanup_hooks.append(result._cleanup)
-        return result
 
     @cached_property
     def template_copy_root(self) -> Path:
@@ -1013,6 +1185,7 @@ class Worker:
                 src_path=self.subproject.template.url,  # type: ignore[union-attr]
                 vcs_ref=self.subproject.template.commit,  # type: ignore[union-attr]
             ) as old_worker:
+                self._share_template(old_worker)
                 old_worker.run_copy()
             # Run pre-migration tasks
             self._execute_tasks(
@@ -1069,6 +1242,7 @@ class Worker:
                 # TODO
                 quiet=True,
             ) as current_worker:
+                self._share_template(current_worker)
                 current_worker.run_copy()
                 self.answers = current_worker.answers
             # Render with the same answers in an empty dir to avoid pollution
@@ -1085,6 +1259,7 @@ class Worker:
                 src_path=self.subproject.template.url,  # type: ignore[union-attr]
                 exclude=exclude_plus_removed,
             ) as new_worker:
+                self._share_template(new_worker)
                 new_worker.run_copy()
             with local.cwd(new_copy):
                 self._git_initialize_repo()
@@ -1201,32 +1376,61 @@ class Worker:
                     # See this SO post: https://stackoverflow.com/questions/79309642/
                     # and Git docs: https://git-scm.com/docs/git-update-index#_using_index_info.
                     if conflicted:
+                        staged = [
+                            line.split("\t")
+                            for line in git("ls-files", "--stage", *conflicted)
+                            .strip()
+                            .splitlines()
+                        ]
+                        # Store the previous and latest versions of all files
+                        # with a single command. A file may not exist in the
+                        # previous version, or may have been deleted in the
+                        # latest one.
+                        versions = [
+                            (path, stage, version_path)
+                            for _, path in staged
+                            for stage, root in ((2, old_path), (3, new_path))
+                            if (
+                                version_path := root / normalize_git_path(path)
+                            ).is_file()
+                        ]
+                        # `--stdin-paths` reads one path per line, so paths
+                        # containing newlines are hashed one by one instead.
+                        batched = [v for v in versions if "\n" not in str(v[2])]
+                        unbatched = [v for v in versions if "\n" in str(v[2])]
+                        version_shas: dict[tuple[str, int], str] = {}
+                        if batched:
+                            hash_cmd = git["hash-object", "-w", "--stdin-paths"]
+                            try:
+                                shas = (
+                                    hash_cmd << "\n".join(str(p) for *_, p in batched)
+                                )().split()
+                            except ProcessExecutionError:
+                                # A single unreadable file fails the whole batch
+                                unbatched += batched
+                            else:
+                                assert len(shas) == len(batched)
+                                version_shas.update(
+                                    ((path, stage), sha)
+                                    for (path, stage, _), sha in zip(batched, shas)
+                                )
+                        for path, stage, version_path in unbatched:
+                            # Unreadable versions are left unstaged
+                            with suppress(ProcessExecutionError):
+                                version_shas[path, stage] = git(
+                                    "hash-object", "-w", "--", str(version_path)
+                                ).strip()
                         input_lines = []
-                        for line in (
-                            git("ls-files", "--stage", *conflicted).strip().splitlines()
-                        ):
-                            perms_sha_mode, path = line.split("\t")
+                        for perms_sha_mode, path in staged:
                             perms, sha, _ = perms_sha_mode.split()
                             input_lines.append(f"0 {'0' * 40}\t{path}")
                             input_lines.append(f"{perms} {sha} 1\t{path}")
-                            with suppress(ProcessExecutionError):
-                                # The following command will fail
-                                # if the file did not exist in the previous version.
-                                old_sha = git(
-                                    "hash-object",
-                                    "-w",
-                                    old_path / normalize_git_path(path),
-                                ).strip()
-                                input_lines.append(f"{perms} {old_sha} 2\t{path}")
-                            with suppress(ProcessExecutionError):
-                                # The following command will fail
-                                # if the file was deleted in the latest version.
-                                new_sha = git(
-                                    "hash-object",
-                                    "-w",
-                                    new_path / normalize_git_path(path),
-                                ).strip()
-                                input_lines.append(f"{perms} {new_sha} 3\t{path}")
+                            for stage in (2, 3):
+                                if (path, stage) in version_shas:
+                                    version_sha = version_shas[path, stage]
+                                    input_lines.append(
+                                        f"{perms} {version_sha} {stage}\t{path}"
+                                    )
                         (
                             git["update-index", "--index-info"]
                             << "\n".join(input_lines)
@@ -1321,6 +1525,20 @@ def run_update(
     return worker
 
 
+@lru_cache(maxsize=128)
+def _compile_path_spec(patterns: tuple[str, ...]) -> PathSpec:
+    """Compile gitignore-style patterns, reusing previous compilations.
+
+    Workers spawned for the same template usually share the same patterns.
+    """
+    return PathSpec.from_lines("gitwildmatch", patterns)
+
+
+def _fold_name(name: str) -> str:
+    """Fold a file name, so names any filesystem may deem equal are equal."""
+    return normalize("NFC", name.casefold())
+
+
 def _remove_old_files(prefix: Path, cmp: dircmp[str], rm_common: bool = False) -> None:
     """Remove files and directories only found in "old" template.
 
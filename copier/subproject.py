@@ -15,6 +15,7 @@ from plumbum.machines import local
 from pydantic.dataclasses import dataclass
 
 from .template import Template
+from .tools import YamlSafeLoader
 from .types import AbsolutePath, AnyByStrDict, VCSTypes
 from .vcs import get_git, is_in_git_repo
 
@@ -55,8 +56,9 @@ class Subproject:
     def _raw_answers(self) -> AnyByStrDict:
         """Get last answers, loaded raw as yaml."""
         try:
-            return yaml.safe_load(
-                (self.local_abspath / self.answers_relpath).read_text()
+            return yaml.load(
+                (self.local_abspath / self.answers_relpath).read_bytes(),
+                Loader=YamlSafeLoader,
             )
         except OSError:
             return {}
@@ -2,22 +2,22 @@
 
 from __future__ import annotations
 
+import dataclasses
 import re
 import sys
-from collections import ChainMap, defaultdict
+from collections import defaultdict
 from contextlib import suppress
 from dataclasses import field
-from functools import cached_property
 from pathlib import Path, PurePosixPath
 from shutil import rmtree
-from typing import Any, Literal, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Literal, Mapping, Sequence
 from warnings import warn
 
 import dunamai
 import packaging.version
 import yaml
-from funcy import lflatten
-from packaging.version import Version, parse
+from packaging.version import Version
 from plumbum.machines import local
 from pydantic.dataclasses import dataclass
 
@@ -28,8 +28,14 @@ from .errors import (
     UnknownCopierVersionWarning,
     UnsupportedVersionError,
 )
-from .tools import copier_version, handle_remove_readonly
-from .types import AnyByStrDict, VCSTypes
+from .tools import (
+    YamlFullLoader,
+    cached_property,
+    copier_version,
+    handle_remove_readonly,
+    parse_version,
+)
+from .types import AnyByStrDict, VCSTypes, path_is_relative
 from .vcs import checkout_latest_tag, clone, get_git, get_repo
 
 # Default list of files in the template to exclude from the rendered project
@@ -46,22 +52,39 @@ DEFAULT_EXCLUDE: tuple[str, ...] = (
 
 DEFAULT_TEMPLATES_SUFFIX = ".jinja"
 
+_DEFAULT_ENVOPS: Mapping[str, Any] = MappingProxyType(
+    {
+        # NOTE: we want to keep trailing newlines in templates as this is what a
+        #       user will most likely expects as a default.
+        #       See https://github.com/copier-org/copier/issues/464
+        "keep_trailing_newline": True,
+    }
+)
+
+_CONFIG_SUFFIXES = frozenset({".yaml", ".yml"})
+
 
 def filter_config(data: AnyByStrDict) -> tuple[AnyByStrDict, AnyByStrDict]:
     """Separates config and questions data."""
-    config_data: AnyByStrDict = {}
-    questions_data = {}
-    for k, v in data.items():
-        if k.startswith("_"):
-            config_data[k[1:]] = v
-        else:
-            # Transform simplified questions format into complex
-            if not isinstance(v, dict):
-                v = {"default": v}
-            questions_data[k] = v
+    config_data = {k[1:]: v for k, v in data.items() if k.startswith("_")}
+    questions_data = {
+        # Transform simplified questions format into complex
+        k: v if isinstance(v, dict) else {"default": v}
+        for k, v in data.items()
+        if not k.startswith("_")
+    }
     return config_data, questions_data
 
 
+def _flatten(items: Iterable[Any]) -> Iterator[Any]:
+    """Flatten nested lists, like the ones produced by `!include` tags."""
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            yield from _flatten(item)
+        else:
+            yield item
+
+
 def load_template_config(conf_path: Path, quiet: bool = False) -> AnyByStrDict:
     """Load the `copier.yml` file.
 
@@ -79,40 +102,48 @@ def load_template_config(conf_path: Path, quiet: bool = False) -> AnyByStrDict:
         InvalidConfigFileError: When the file is formatted badly.
     """
 
-    class _Loader(yaml.FullLoader):
+    class _Loader(YamlFullLoader):
         """Intermediate class to avoid monkey-patching main loader."""
 
+    # Files matched by several includes are read and parsed only once
+    included: dict[Path, Any] = {}
+
     def _include(loader: yaml.Loader, node: yaml.Node) -> Any:
         if not isinstance(node, yaml.ScalarNode):
             raise ValueError(f"Unsupported YAML node: {node!r}")
         include_file = str(loader.construct_scalar(node))
         if PurePosixPath(include_file).is_absolute():
             raise ValueError("YAML include file path must be a relative path")
-        return [
-            yaml.load(path.read_bytes(), Loader=type(loader))
-            for path in conf_path.parent.glob(include_file)
-        ]
+        result = []
+        for path in conf_path.parent.glob(include_file):
+            if path not in included:
+                included[path] = yaml.load(path.read_bytes(), Loader=type(loader))
+            result.append(included[path])
+        return result
 
     _Loader.add_constructor("!include", _include)
 
-    with conf_path.open("rb") as f:
-        try:
-            flattened_result = lflatten(filter(None, yaml.load_all(f, Loader=_Loader)))
-        except yaml.parser.ParserError as e:
-            raise InvalidConfigFileError(conf_path, quiet) from e
-
-    merged_options = defaultdict(list)
-    for option in (
-        "_exclude",
-        "_jinja_extensions",
-        "_secret_questions",
-        "_skip_if_exists",
-    ):
-        for result in flattened_result:
-            if option in result:
-                merged_options[option].extend(result[option])
-
-    return dict(ChainMap(dict(merged_options), *reversed(flattened_result)))
+    # Later sections override earlier ones, except for these options, which
+    # are merged across all sections
+    result: AnyByStrDict = {}
+    merged_options: defaultdict[str, list[Any]] = defaultdict(list)
+    documents = yaml.load_all(conf_path.read_bytes(), Loader=_Loader)
+    try:
+        # Sections are merged as they are parsed, without buffering them
+        for section in _flatten(filter(None, documents)):
+            result.update(section)
+            for option in (
+                "_exclude",
+                "_jinja_extensions",
+                "_secret_questions",
+                "_skip_if_exists",
+            ):
+                if option in section:
+                    merged_options[option].extend(section[option])
+    except (yaml.parser.ParserError, yaml.scanner.ScannerError) as e:
+        raise InvalidConfigFileError(conf_path, quiet) from e
+    result.update(merged_options)
+    return result
 
 
 def verify_copier_version(version_str: str) -> None:
@@ -131,7 +162,7 @@ def verify_copier_version(version_str: str) -> None:
             UnknownCopierVersionWarning,
         )
         return
-    parsed_min = Version(version_str)
+    parsed_min = parse_version(version_str)
     if installed_version < parsed_min:
         raise UnsupportedVersionError(
             f"This template requires Copier version >= {version_str}, "
@@ -176,7 +207,7 @@ class Task:
     working_directory: Path = Path(".")
 
 
-@dataclass
+@dataclasses.dataclass(frozen=True)
 class Template:
     """Object that represents a template and its current state.
 
@@ -256,7 +287,7 @@ class Template:
         conf_paths = [
             p
             for p in self.local_abspath.glob("copier.*")
-            if p.is_file() and re.match(r"\.ya?ml", p.suffix, re.I)
+            if p.suffix.lower() in _CONFIG_SUFFIXES and p.is_file()
         ]
         if len(conf_paths) > 1:
             raise MultipleConfigFilesError(conf_paths)
@@ -272,9 +303,9 @@ class Template:
 
         See [answers_file][].
         """
-        result = Path(self.config_data.get("answers_file", ".copier-answers.yml"))
-        assert not result.is_absolute()
-        return result
+        return path_is_relative(
+            Path(self.config_data.get("answers_file", ".copier-answers.yml"))
+        )
 
     @cached_property
     def commit(self) -> str | None:
@@ -291,6 +322,11 @@ class Template:
             return get_git()("-C", self.local_abspath, "rev-parse", "HEAD").strip()
         return None
 
+    @cached_property
+    def _config_and_questions(self) -> tuple[AnyByStrDict, AnyByStrDict]:
+        """Split the raw config once for both `config_data` and `questions_data`."""
+        return filter_config(self._raw_config)
+
     @cached_property
     def config_data(self) -> AnyByStrDict:
         """Get config from the template.
@@ -298,7 +334,7 @@ class Template:
         It reads [the `copier.yml` file][the-copieryml-file] to get its
         [settings][available-settings].
         """
-        result = filter_config(self._raw_config)[0]
+        result = self._config_and_questions[0]
         with suppress(KeyError):
             verify_copier_version(result["min_copier_version"])
         return result
@@ -309,12 +345,7 @@ class Template:
 
         See [envops][].
         """
-        result = self.config_data.get("envops", {})
-        # NOTE: we want to keep trailing newlines in templates as this is what a
-        #       user will most likely expects as a default.
-        #       See https://github.com/copier-org/copier/issues/464
-        result.setdefault("keep_trailing_newline", True)
-        return result
+        return {**_DEFAULT_ENVOPS, **self.config_data.get("envops", {})}
 
     @cached_property
     def exclude(self) -> tuple[str, ...]:
@@ -322,12 +353,9 @@ class Template:
 
         See [exclude][].
         """
-        return tuple(
-            self.config_data.get(
-                "exclude",
-                DEFAULT_EXCLUDE if Path(self.subdirectory) == Path(".") else [],
-            )
-        )
+        if "exclude" in self.config_data:
+            return tuple(self.config_data["exclude"])
+        return DEFAULT_EXCLUDE if Path(self.subdirectory) == Path(".") else ()
 
     @cached_property
     def jinja_extensions(self) -> tuple[str, ...]:
@@ -383,64 +411,66 @@ class Template:
             from_template: Original template, from which we are migrating.
         """
         result: list[Task] = []
-        if not (self.version and from_template.version):
+        to_version, from_version = self.version, from_template.version
+        if not (to_version and from_version):
             return []
         extra_vars: dict[str, Any] = {
             "stage": stage,
             "version_from": from_template.commit,
             "version_to": self.commit,
-            "version_pep440_from": from_template.version,
-            "version_pep440_to": self.version,
+            "version_pep440_from": from_version,
+            "version_pep440_to": to_version,
         }
-        migration: dict[str, Any]
+        migration: dict[str, Any] | str | list[str]
         for migration in self._raw_config.get("_migrations", []):
-            if any(key in migration for key in ("before", "after")):
+            if isinstance(migration, (str, list)):
+                # New configuration format, command only
+                result.append(
+                    Task(
+                        cmd=migration,
+                        extra_vars=extra_vars,
+                        condition='{{ _stage == "after" }}',
+                    )
+                )
+            elif "before" in migration or "after" in migration:
                 # Legacy configuration format
                 warn(
                     "This migration configuration is deprecated. Please switch to the new format.",
                     category=DeprecationWarning,
                 )
-                current = parse(migration["version"])
-                if self.version >= current > from_template.version:
-                    extra_vars = {
+                current = parse_version(migration["version"])
+                if to_version >= current > from_version:
+                    migration_vars = {
                         **extra_vars,
                         "version_current": migration["version"],
                         "version_pep440_current": current,
                     }
                     result.extend(
-                        Task(cmd=cmd, extra_vars=extra_vars)
+                        Task(cmd=cmd, extra_vars=migration_vars)
                         for cmd in migration.get(stage, [])
                     )
             else:
                 # New configuration format
-                if isinstance(migration, (str, list)):
-                    result.append(
-                        Task(
-                            cmd=migration,
-                            extra_vars=extra_vars,
-                            condition='{{ _stage == "after" }}',
-                        )
-                    )
-                else:
-                    condition = migration.get("when", '{{ _stage == "after" }}')
-                    working_directory = Path(migration.get("working_directory", "."))
-                    if "version" in migration:
-                        current = parse(migration["version"])
-                        if not (self.version >= current > from_template.version):
-                            continue
-                        extra_vars = {
-                            **extra_vars,
-                            "version_current": migration["version"],
-                            "version_pep440_current": current,
-                        }
-                    result.append(
-                        Task(
-                            cmd=migration["command"],
-                            extra_vars=extra_vars,
-                            condition=condition,
-                            working_directory=working_directory,
-                        )
+                condition = migration.get("when", '{{ _stage == "after" }}')
+                working_directory = Path(migration.get("working_directory", "."))
+                migration_vars = extra_vars
+                if "version" in migration:
+                    current = parse_version(migration["version"])
+                    if not (to_version >= current > from_version):
+                        continue
+                    migration_vars = {
+                        **extra_vars,
+                        "version_current": migration["version"],
+                        "version_pep440_current": current,
+                    }
+                result.append(
+                    Task(
+                        cmd=migration["command"],
+                        extra_vars=migration_vars,
+                        condition=condition,
+                        working_directory=working_directory,
                     )
+                )
 
         return result
 
@@ -451,7 +481,7 @@ class Template:
         See [min_copier_version][].
         """
         try:
-            return Version(self.config_data["min_copier_version"])
+            return parse_version(self.config_data["min_copier_version"])
         except KeyError:
             return None
 
@@ -461,8 +491,8 @@ class Template:
 
         See [questions][].
         """
-        result = filter_config(self._raw_config)[1]
-        for key in set(self.config_data.get("secret_questions", [])):
+        result = self._config_and_questions[1]
+        for key in self.config_data.get("secret_questions", []):
             if key in result:
                 result[key]["secret"] = True
         return result
@@ -473,10 +503,11 @@ class Template:
 
         These questions shouldn't be saved into the answers file.
         """
-        result = set(self.config_data.get("secret_questions", []))
-        for key, value in self.questions_data.items():
-            if value.get("secret"):
-                result.add(key)
+        # questions_data already flags the listed ones that are questions
+        result = {
+            key for key, value in self.questions_data.items() if value.get("secret")
+        }
+        result.update(self.config_data.get("secret_questions", []))
         return result
 
     @cached_property
@@ -551,17 +582,24 @@ class Template:
         This may clone it if `url` points to a VCS-tracked template.
         Dirty changes for local VCS-tracked templates will be copied.
         """
-        result = Path(self.url)
         if self.vcs == "git":
+            # A fresh clone is always a directory
             result = Path(clone(self.url_expanded, self.ref))
             if self.ref is None:
                 checkout_latest_tag(result, self.use_prereleases)
-        if not result.is_dir():
-            raise ValueError("Local template must be a directory.")
+        else:
+            result = Path(self.url)
+            if not result.is_dir():
+                raise ValueError("Local template must be a directory.")
         with suppress(OSError):
             result = result.resolve()
         return result
 
+    @cached_property
+    def _repo(self) -> str | None:
+        """Get the git-parseable origin of the template, if it is a git repo."""
+        return get_repo(self.url)
+
     @cached_property
     def url_expanded(self) -> str:
         """Get usable URL.
@@ -570,7 +608,7 @@ class Template:
         format, which wouldn't be understood by the underlying VCS system. This
         property returns the expanded version, which should work properly.
         """
-        return get_repo(self.url) or self.url
+        return self._repo or self.url
 
     @cached_property
     def version(self) -> Version | None:
@@ -603,6 +641,6 @@ class Template:
     @cached_property
     def vcs(self) -> VCSTypes | None:
         """Get VCS system used by the template, if any."""
-        if get_repo(self.url):
+        if self._repo:
             return "git"
         return None
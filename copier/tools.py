@@ -11,18 +11,78 @@ import sys
 from contextlib import suppress
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache, partial
 from importlib.metadata import version
+from io import BytesIO
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Callable, Iterator, Literal, TextIO, cast
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    Literal,
+    TextIO,
+    TypeVar,
+    cast,
+    overload,
+)
 
 import colorama
 from packaging.version import Version
 from pathspec.patterns.gitwildmatch import GitWildMatchPattern
 from pydantic import StrictBool
 
+try:
+    from yaml import CFullLoader as _FullLoader, CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import (  # type: ignore[assignment]
+        FullLoader as _FullLoader,
+        SafeLoader as _SafeLoader,
+    )
+
 colorama.just_fix_windows_console()
 
+_T = TypeVar("_T")
+
+if sys.version_info >= (3, 12):
+    from functools import cached_property
+else:
+
+    class cached_property(Generic[_T]):
+        """Lock-free version of `functools.cached_property`.
+
+        Before Python 3.12, the standard one holds a lock while computing the
+        value. Copier does not share these objects among threads, so it does
+        not need it.
+        """
+
+        def __init__(self, func: Callable[[Any], _T]) -> None:
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+            self.__module__ = func.__module__
+
+        def __set_name__(self, owner: type[Any], name: str) -> None:
+            self.attrname = name
+
+        @overload
+        def __get__(
+            self, instance: None, owner: type[Any] | None = None
+        ) -> cached_property[_T]: ...
+
+        @overload
+        def __get__(self, instance: object, owner: type[Any] | None = None) -> _T: ...
+
+        def __get__(
+            self, instance: object | None, owner: type[Any] | None = None
+        ) -> cached_property[_T] | _T:
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
 
 class Style:
     """Common color styles."""
@@ -34,6 +94,10 @@ class Style:
     RESET = [colorama.Fore.RESET, colorama.Style.RESET_ALL]
 
 
+# YAML loaders, backed by libyaml when available because it is much faster
+YamlFullLoader = _FullLoader
+YamlSafeLoader = _SafeLoader
+
 INDENT = " " * 2
 HLINE = "-" * 42
 
@@ -47,6 +111,12 @@ OS: Literal["linux", "macos", "windows"] | None = cast(
 )
 
 
+@lru_cache(maxsize=1024)
+def parse_version(version_str: str) -> Version:
+    """Parse a PEP 440 version, reusing previous results for the same string."""
+    return Version(version_str)
+
+
 def copier_version() -> Version:
     """Get closest match for the installed copier version."""
     # Importing __version__ at the top of the module creates a circular import
@@ -55,10 +125,10 @@ def copier_version() -> Version:
     from . import __version__
 
     if __version__ != "0.0.0":
-        return Version(__version__)
+        return parse_version(__version__)
 
     # Get the installed package version otherwise, which is sometimes more specific
-    return Version(version("copier"))
+    return parse_version(version("copier"))
 
 
 def printf(
@@ -178,6 +248,28 @@ def handle_remove_readonly(
 _re_whitespace = re.compile(r"^\s+|\s+$")
 
 
+def file_contents_equal(
+    path: Path, contents: bytes | Path, chunk_size: int = 65536
+) -> bool:
+    """Tell if a file holds exactly the given contents.
+
+    `contents` can also be the path to another file holding them. Sizes are
+    compared first, and then files are read in chunks, so they are never
+    loaded whole in memory.
+    """
+    expected: IO[bytes] = (
+        contents.open("rb") if isinstance(contents, Path) else BytesIO(contents)
+    )
+    with expected, path.open("rb") as fd:
+        if os.fstat(fd.fileno()).st_size != expected.seek(0, os.SEEK_END):
+            return False
+        expected.seek(0)
+        for chunk in iter(partial(fd.read, chunk_size), b""):
+            if expected.read(len(chunk)) != chunk:
+                return False
+        return not expected.read(1)
+
+
 def normalize_git_path(path: str) -> str:
     r"""Convert weird characters returned by Git to normal UTF-8 path strings.
 
@@ -194,6 +286,9 @@ def normalize_git_path(path: str) -> str:
     # Remove surrounding quotes
     if path[0] == path[-1] == '"':
         path = path[1:-1]
+    # Nothing is escaped, which is the usual case
+    if "\\" not in path:
+        return path
     # Repair double-quotes
     path = path.replace('\\"', '"')
     # Unescape escape characters
@@ -259,8 +354,21 @@ def set_git_alternates(*repos: Path, path: Path = Path(".")) -> None:
 
 
 def scantree(path: str, follow_symlinks: bool) -> Iterator[os.DirEntry[str]]:
-    """A recursive extension of `os.scandir`."""
-    for entry in os.scandir(path):
-        yield entry
-        if entry.is_dir(follow_symlinks=follow_symlinks):
-            yield from scantree(entry.path, follow_symlinks)
+    """A recursive extension of `os.scandir`.
+
+    Entries are yielded in pre-order, walking the tree with a stack of open
+    directory iterators instead of nested generators.
+    """
+    stack = [os.scandir(path)]
+    try:
+        while stack:
+            for entry in stack[-1]:
+                yield entry
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    stack.append(os.scandir(entry.path))
+                    break
+            else:
+                stack.pop().close()
+    finally:
+        for iterator in stack:
+            iterator.close()
@@ -5,11 +5,13 @@ from typing import (
     Annotated,
     Any,
     Dict,
+    List,
     Literal,
     Mapping,
     NewType,
     Optional,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -33,6 +35,7 @@ T = TypeVar("T")
 JSONSerializable = (dict, list, str, int, float, bool, type(None))
 VCSTypes = Literal["git"]
 Env = Mapping[str, str]
+RenderedParentsCache = Dict[Tuple[str, ...], List[Tuple[Tuple[str, ...], AnyByStrDict]]]
 MissingType = NewType("MissingType", object)
 MISSING = MissingType(object())
 
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import json
 import warnings
-from collections import ChainMap
 from dataclasses import field
 from datetime import datetime
-from functools import cached_property
+from functools import cache, cached_property
 from hashlib import sha512
 from os import urandom
 from pathlib import Path
@@ -20,11 +19,13 @@ from prompt_toolkit.lexers import PygmentsLexer
 from pydantic import ConfigDict, Field, field_validator
 from pydantic.dataclasses import dataclass
 from pydantic_core.core_schema import ValidationInfo
+from pygments.lexer import Lexer
 from pygments.lexers.data import JsonLexer, YamlLexer
 from questionary.prompts.common import Choice
 
 from .errors import InvalidTypeError, UserMessageError
-from .tools import cast_to_bool, cast_to_str, force_str_end
+from .jinja_ext import compile_template, is_verbatim
+from .tools import YamlSafeLoader, cast_to_bool, cast_to_str, force_str_end
 from .types import MISSING, AnyByStrDict, MissingType, OptStrOrPath, StrOrPath
 
 
@@ -98,16 +99,14 @@ class AnswersMap:
     @property
     def combined(self) -> Mapping[str, Any]:
         """Answers combined from different sources, sorted by priority."""
-        return dict(
-            ChainMap(
-                self.user,
-                self.init,
-                self.metadata,
-                self.last,
-                self.user_defaults,
-                DEFAULT_DATA,
-            )
-        )
+        return {
+            **DEFAULT_DATA,
+            **self.user_defaults,
+            **self.last,
+            **self.metadata,
+            **self.init,
+            **self.user,
+        }
 
     def old_commit(self) -> str | None:
         """Commit when the project was updated from this template the last time."""
@@ -356,7 +355,6 @@ class Question:
                 return "Invalid input"
             return self.validate_answer(ans) or True
 
-        lexer = None
         result: AnyByStrDict = {
             "filter": self.cast_answer,
             "message": self.get_message(),
@@ -381,12 +379,8 @@ class Question:
         if questionary_type == "input":
             if self.secret:
                 questionary_type = "password"
-            elif type_name == "yaml":
-                lexer = PygmentsLexer(YamlLexer)
-            elif type_name == "json":
-                lexer = PygmentsLexer(JsonLexer)
-            if lexer:
-                result["lexer"] = lexer
+            elif type_name in _LEXERS:
+                result["lexer"] = _get_lexer(type_name)
             result["multiline"] = self.get_multiline()
             if placeholder := self.get_placeholder():
                 result["placeholder"] = placeholder
@@ -431,43 +425,47 @@ class Question:
         `extra_answers` are combined self `self.answers.combined` when rendering
         the template.
         """
-        try:
-            template = self.jinja_env.from_string(value)
-        except TypeError:
-            # value was not a string
+        if not isinstance(value, str):
             return (
                 [self.render_value(item) for item in value]
                 if isinstance(value, list)
                 else value
             )
+        if is_verbatim(self.jinja_env, value):
+            return value
+        template = compile_template(self.jinja_env, value)
+        context = self.answers.combined
+        if extra_answers:
+            context = {**context, **extra_answers}
         try:
-            return template.render({**self.answers.combined, **(extra_answers or {})})
+            return template.render(context)
         except UndefinedError as error:
             raise UserMessageError(str(error)) from error
 
     def parse_answer(self, answer: Any) -> Any:
         """Parse the answer according to the question's type."""
+        # Cast choices once, instead of once for every answered item
+        choices = [
+            (self.cast_answer(choice.value), choice.disabled)
+            for choice in self._formatted_choices
+        ]
         if self.multiselect:
-            answer = [self._parse_answer(a) for a in answer]
-            choices = (
-                self.cast_answer(choice.value) for choice in self._formatted_choices
-            )
-            return [choice for choice in choices if choice in answer]
-        return self._parse_answer(answer)
+            answer = [self._parse_answer(a, choices) for a in answer]
+            return [value for value, _ in choices if value in answer]
+        return self._parse_answer(answer, choices)
 
-    def _parse_answer(self, answer: Any) -> Any:
+    def _parse_answer(self, answer: Any, choices: Sequence[tuple[Any, Any]]) -> Any:
         """Parse a single answer according to the question's type."""
         ans = self.cast_answer(answer)
-        choices = self._formatted_choices
         if not choices:
             return ans
         choice_error = ""
-        for choice in choices:
-            if ans == self.cast_answer(choice.value):
-                if not choice.disabled:
+        for value, disabled in choices:
+            if ans == value:
+                if not disabled:
                     return ans
                 if not choice_error:
-                    choice_error = choice.disabled
+                    choice_error = disabled
         raise ValueError(
             f"Invalid choice: {choice_error}" if choice_error else "Invalid choice"
         )
@@ -480,7 +478,7 @@ def parse_yaml_string(string: str) -> Any:
     to repeat failed questions.
     """
     try:
-        return yaml.safe_load(string)
+        return yaml.load(string, Loader=YamlSafeLoader)
     except yaml.error.YAMLError as error:
         raise ValueError(str(error))
 
@@ -491,12 +489,27 @@ def load_answersfile_data(
 ) -> AnyByStrDict:
     """Load answers data from a `$dst_path/$answers_file` file if it exists."""
     try:
-        with open(Path(dst_path) / (answers_file or ".copier-answers.yml")) as fd:
-            return yaml.safe_load(fd)
+        return yaml.load(
+            (Path(dst_path) / (answers_file or ".copier-answers.yml")).read_bytes(),
+            Loader=YamlSafeLoader,
+        )
     except FileNotFoundError:
         return {}
 
 
+# Syntax highlighting for question types that support it
+_LEXERS: Mapping[str, type[Lexer]] = {
+    "json": JsonLexer,
+    "yaml": YamlLexer,
+}
+
+
+@cache
+def _get_lexer(type_name: str) -> PygmentsLexer:
+    """Get the syntax highlighter for a question type, shared by all prompts."""
+    return PygmentsLexer(_LEXERS[type_name])
+
+
 CAST_STR_TO_NATIVE: Mapping[str, Callable[[str], Any]] = {
     "bool": cast_to_bool,
     "float": float,
@@ -83,6 +83,9 @@ def is_git_shallow_repo(path: StrOrPath) -> bool:
 
 def is_git_bundle(path: Path) -> bool:
     """Indicate if a path is a valid git bundle."""
+    # Folders and missing paths are common here, avoid spawning git for them
+    if not path.is_file():
+        return False
     with suppress(OSError):
         path = path.resolve()
     with TemporaryDirectory(prefix=f"{__name__}.is_git_bundle.") as dirname:
@@ -9,9 +9,14 @@ from plumbum import local
 from pydantic import ValidationError
 
 import copier
-from copier.errors import InvalidConfigFileError, MultipleConfigFilesError
+from copier.errors import (
+    InvalidConfigFileError,
+    MultipleConfigFilesError,
+    PathNotRelativeError,
+)
 from copier.template import DEFAULT_EXCLUDE, Task, Template, load_template_config
 from copier.types import AnyByStrDict
+from copier.user_data import AnswersMap
 
 from .helpers import BRACKET_ENVOPS_JSON, SUFFIX_TMPL, build_file_tree, git_init
 
@@ -38,6 +43,23 @@ def test_config_data_is_loaded_from_file() -> None:
     ]
 
 
+def test_worker_render_context_follows_answers(tmp_path: Path) -> None:
+    conf = copier.Worker("./tests/demo_data", tmp_path)
+    assert "project_name" not in conf._render_context
+    conf.answers = AnswersMap(user={"project_name": "demo"})
+    assert conf._render_context["project_name"] == "demo"
+    assert conf._render_context["_copier_conf"]["answers"]["user"] == {
+        "project_name": "demo"
+    }
+
+
+def test_worker_render_context_cannot_change_config(tmp_path: Path) -> None:
+    conf = copier.Worker("./tests/demo_data", tmp_path, exclude=["a"])
+    conf._render_string("{{ _copier_conf.exclude.append('b') }}")
+    assert conf._render_string("{{ (_copier_conf.exclude + ['c']) | join }}") == "ac"
+    assert conf.exclude == ["a"]
+
+
 def test_config_data_is_merged_from_files() -> None:
     tpl = Template("tests/demo_merge_options_from_answerfiles")
     assert list(tpl.skip_if_exists) == [
@@ -243,6 +265,21 @@ def test_include_value_must_be_scalar_node(tmp_path: Path, include_value: str) -
         template.config_data  # noqa: B018
 
 
+def test_answers_file_must_be_relative(tmp_path: Path) -> None:
+    build_file_tree(
+        {
+            (tmp_path / "copier.yml"): (
+                """\
+                _answers_file: /absolute/path/to/.copier-answers.yml
+                """
+            ),
+        }
+    )
+    template = Template(str(tmp_path))
+    with pytest.raises(PathNotRelativeError):
+        template.answers_relpath  # noqa: B018
+
+
 def test_config_data_empty() -> None:
     template = Template("tests/demo_config_empty")
     assert template.config_data == {}
@@ -292,7 +329,7 @@ def is_subdict(small: dict[Any, Any], big: dict[Any, Any]) -> bool:
 def test_worker_good_data(tmp_path: Path) -> None:
     # This test is probably useless, as it tests the what and not the how
     conf = copier.Worker("./tests/demo_data", tmp_path)
-    assert conf._render_context()["_folder_name"] == tmp_path.name
+    assert conf._render_context["_folder_name"] == tmp_path.name
     assert conf.all_exclusions == ("exclude1", "exclude2")
     assert conf.template.skip_if_exists == ["skip_if_exists1", "skip_if_exists2"]
     assert conf.template.tasks == [
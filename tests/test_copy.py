@@ -343,6 +343,16 @@ def test_force_option(tmp_path: Path) -> None:
     assert path.read_text() != content
 
 
+def test_force_option_raw_file(tmp_path: Path) -> None:
+    render(tmp_path)
+    path = tmp_path / "awesome" / "hello.txt"
+    original = path.read_bytes()
+    # Same size, different contents
+    path.write_bytes(original.swapcase())
+    render(tmp_path, defaults=True, overwrite=True)
+    assert path.read_bytes() == original
+
+
 def test_pretend_option(tmp_path: Path) -> None:
     render(tmp_path, pretend=True)
     assert not (tmp_path / "doc").exists()
@@ -1042,3 +1052,47 @@ def test_templated_choices(tmp_path_factory: pytest.TempPathFactory, spec: str)
     )
     copier.run_copy(str(src), dst, data={"q": "two"})
     assert yaml.safe_load((dst / "q.txt").read_text()) == "two"
+
+
+@pytest.mark.parametrize(
+    "name, spelling",
+    [
+        ("README.txt.jinja", "readme.txt.jinja"),
+        ("\u00e9t\u00e9.txt.jinja", "e\u0301te\u0301.txt.jinja"),
+    ],
+)
+def test_templated_sibling_spelled_differently(
+    tmp_path_factory: pytest.TempPathFactory, name: str, spelling: str
+) -> None:
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+    build_file_tree({(src / name): "rendered"})
+    with copier.Worker(str(src), dst) as worker:
+        # Names only match as the filesystem compares them
+        assert worker._template_path_exists(spelling) is (src / spelling).exists()
+        assert worker._template_path_exists(name)
+        assert not worker._template_path_exists(f"missing-{name}")
+
+
+def test_templates_cannot_change_context_of_others(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+    mutating = (
+        "{{ _copier_answers.pop('name', 'GONE') }} "
+        "{{ _copier_conf.data.pop('name', 'GONE') }} "
+        "{{ _copier_conf.exclude.pop() }}"
+    )
+    build_file_tree(
+        {
+            (src / "copier.yml"): "name: str",
+            (src / "{{ _copier_conf.answers_file }}.jinja"): (
+                "{{ _copier_answers|to_nice_yaml }}"
+            ),
+            **{(src / f"{name}.txt.jinja"): mutating for name in "abcd"},
+        }
+    )
+    copier.run_copy(str(src), dst, data={"name": "demo"}, exclude=["excluded"])
+    for name in "abcd":
+        assert (dst / f"{name}.txt").read_text() == "demo demo excluded"
+    answers = yaml.safe_load((dst / ".copier-answers.yml").read_text())
+    assert answers["name"] == "demo"
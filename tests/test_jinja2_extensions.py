@@ -1,4 +1,8 @@
+from __future__ import annotations
+
+import gc
 import json
+import weakref
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +11,7 @@ from jinja2 import Environment
 from jinja2.ext import Extension
 
 import copier
+from copier.jinja_ext import YieldEnvironment, YieldExtension, compile_template
 
 from .helpers import PROJECT_TEMPLATE, build_file_tree
 
@@ -36,6 +41,20 @@ class GlobalsExtension(Extension):
         environment.globals.update(super_var="super var!")
 
 
+class CountingExtension(Extension):
+    """Jinja2 extension that counts how many sources it preprocessed."""
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        self.count = 0
+
+    def preprocess(
+        self, source: str, _name: str | None, _filename: str | None = None
+    ) -> str:
+        self.count += 1
+        return source
+
+
 def test_default_jinja2_extensions(tmp_path: Path) -> None:
     copier.run_copy(str(PROJECT_TEMPLATE) + "_extensions_default", tmp_path)
     super_file = tmp_path / "super_file.md"
@@ -64,3 +83,23 @@ def test_to_json_filter_with_conf(tmp_path_factory: pytest.TempPathFactory) -> N
     assert conf_file.exists()
     # must not raise an error
     assert json.loads(conf_file.read_text())
+
+
+def test_compiled_templates_do_not_keep_environment_alive() -> None:
+    env = YieldEnvironment(extensions=[YieldExtension])
+    assert compile_template(env, "{{ foo }}") is compile_template(env, "{{ foo }}")
+    env_ref = weakref.ref(env)
+    del env
+    gc.collect()
+    assert env_ref() is None
+
+
+def test_compile_template_preprocesses_with_custom_extensions() -> None:
+    env = YieldEnvironment(extensions=[YieldExtension, CountingExtension])
+    compile_template(env, "{{ foo }}")
+    compile_template(env, "{{ foo }}")
+    extension = env.extensions[
+        f"{CountingExtension.__module__}.{CountingExtension.__name__}"
+    ]
+    assert isinstance(extension, CountingExtension)
+    assert extension.count == 2
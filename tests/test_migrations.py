@@ -18,7 +18,11 @@ from .helpers import (
 SRC = Path(f"{PROJECT_TEMPLATE}_migrations").absolute()
 
 
-def test_basic_migration(tmp_path_factory: pytest.TempPathFactory) -> None:
+# Commands mentioning a stage name must not be taken for the legacy format
+@pytest.mark.parametrize("filename", ["foo", "before_after"])
+def test_basic_migration(
+    tmp_path_factory: pytest.TempPathFactory, filename: str
+) -> None:
     """Test a basic migration running on every version"""
     src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
 
@@ -27,9 +31,9 @@ def test_basic_migration(tmp_path_factory: pytest.TempPathFactory) -> None:
             {
                 **COPIER_ANSWERS_FILE,
                 "copier.yml": (
-                    """\
+                    f"""\
                     _migrations:
-                        - touch foo
+                        - touch {filename}
                     """
                 ),
             }
@@ -39,14 +43,14 @@ def test_basic_migration(tmp_path_factory: pytest.TempPathFactory) -> None:
         run_copy(src_path=str(src))
         git_save()
 
-    assert not (dst / "foo").exists()  # Migrations don't run on initial copy
+    assert not (dst / filename).exists()  # Migrations don't run on initial copy
 
     with local.cwd(src):
         git("tag", "v2")
     with local.cwd(dst):
         run_update(defaults=True, overwrite=True, unsafe=True)
 
-    assert (dst / "foo").is_file()
+    assert (dst / filename).is_file()
 
 
 def test_requires_unsafe(tmp_path_factory: pytest.TempPathFactory) -> None:
@@ -521,3 +525,38 @@ def test_migration_jinja_variables(
             assert f"{variable}={value}" in vars
         else:
             assert f"{variable}=" in vars
+
+
+def test_migration_current_version_not_leaked(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Test that unversioned migrations don't get a previous migration's version"""
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+
+    with local.cwd(src):
+        build_file_tree(
+            {
+                **COPIER_ANSWERS_FILE,
+                "copier.yml": (
+                    """\
+                    _migrations:
+                    -   version: v2
+                        command: "true"
+                    -   command: env > env.txt
+                    """
+                ),
+            }
+        )
+        git_save(tag="v1")
+    with local.cwd(dst):
+        run_copy(src_path=str(src))
+        git_save()
+
+    with local.cwd(src):
+        git_save(tag="v2", allow_empty=True)
+    with local.cwd(dst):
+        run_update(defaults=True, overwrite=True, unsafe=True)
+
+    env = (dst / "env.txt").read_text().split("\n")
+    assert "VERSION_TO=v2" in env
+    assert not any(line.startswith("VERSION_CURRENT=") for line in env)
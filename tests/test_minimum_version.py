@@ -1,4 +1,5 @@
 import warnings
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 
 import pytest
@@ -15,7 +16,7 @@ from copier.errors import (
 from .helpers import build_file_tree, git
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def template_path(tmp_path_factory: pytest.TempPathFactory) -> str:
     root = tmp_path_factory.mktemp("template")
     build_file_tree(
@@ -31,30 +32,28 @@ def template_path(tmp_path_factory: pytest.TempPathFactory) -> str:
     return str(root)
 
 
-def test_version_less_than_required(
-    template_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    "version, expectation",
+    [
+        pytest.param(
+            "0.0.0a0", pytest.raises(UnsupportedVersionError), id="less_than_required"
+        ),
+        pytest.param("10.5.1", nullcontext(), id="equal_required"),
+        pytest.param("99.99.99", nullcontext(), id="greater_than_required"),
+    ],
+)
+def test_version_required(
+    template_path: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    version: str,
+    expectation: AbstractContextManager[object],
 ) -> None:
-    monkeypatch.setattr("copier.__version__", "0.0.0a0")
-    with pytest.raises(UnsupportedVersionError):
+    monkeypatch.setattr("copier.__version__", version)
+    with expectation:
         copier.run_copy(template_path, tmp_path)
 
 
-def test_version_equal_required(
-    template_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr("copier.__version__", "10.5.1")
-    # assert no error
-    copier.run_copy(template_path, tmp_path)
-
-
-def test_version_greater_than_required(
-    template_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr("copier.__version__", "99.99.99")
-    # assert no error
-    copier.run_copy(template_path, tmp_path)
-
-
 def test_minimum_version_update(
     template_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -224,6 +224,36 @@ def test_templated_prompt_custom_envops(
     assert (dst / "result").read_text() == "It's only 1..."
 
 
+def test_templated_prompt_line_statements(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+    build_file_tree(
+        {
+            (src / "copier.yml"): (
+                """\
+                _envops:
+                    line_statement_prefix: "%%"
+
+                powerlevel:
+                    type: int
+                    default: 9000
+
+                sentence:
+                    type: str
+                    default: |
+                        %% if powerlevel >= 9000
+                        over 9000
+                        %% endif
+                """
+            ),
+            (src / "result.jinja"): "{{ sentence }}",
+        }
+    )
+    Worker(str(src), dst, defaults=True, overwrite=True).run_copy()
+    assert (dst / "result").read_text() == "over 9000\n"
+
+
 def test_templated_prompt_builtins(tmp_path_factory: pytest.TempPathFactory) -> None:
     src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
     build_file_tree(
@@ -1,11 +1,12 @@
 from pathlib import Path
 from stat import S_IREAD
 from tempfile import TemporaryDirectory
+from typing import Callable
 
 import pytest
 from poethepoet.app import PoeThePoet
 
-from copier.tools import normalize_git_path
+from copier.tools import file_contents_equal, normalize_git_path
 
 from .helpers import git
 
@@ -16,20 +17,27 @@ def test_types() -> None:
     assert result == 0
 
 
-def test_temporary_directory_with_readonly_files_deletion() -> None:
-    """Ensure temporary directories containing read-only files are properly deleted, whatever the OS."""
-    with TemporaryDirectory() as tmp_dir:
-        ro_file = Path(tmp_dir) / "readonly.txt"
-        with ro_file.open("w") as fp:
-            fp.write("don't touch me!")
-        ro_file.chmod(S_IREAD)
-    assert not Path(tmp_dir).exists()
+def _add_readonly_file(path: Path) -> None:
+    ro_file = path / "readonly.txt"
+    ro_file.write_text("don't touch me!")
+    ro_file.chmod(S_IREAD)
+
+
+def _init_git_repo(path: Path) -> None:
+    git("init", path)
 
 
-def test_temporary_directory_with_git_repo_deletion() -> None:
-    """Ensure temporary directories containing git repositories are properly deleted, whatever the OS."""
+@pytest.mark.parametrize(
+    "populate",
+    [
+        pytest.param(_add_readonly_file, id="readonly_files"),
+        pytest.param(_init_git_repo, id="git_repo"),
+    ],
+)
+def test_temporary_directory_deletion(populate: Callable[[Path], None]) -> None:
+    """Ensure temporary directories with read-only files or git repositories are properly deleted, whatever the OS."""
     with TemporaryDirectory() as tmp_dir:
-        git("init")
+        populate(Path(tmp_dir))
     assert not Path(tmp_dir).exists()
 
 
@@ -37,6 +45,7 @@ def test_temporary_directory_with_git_repo_deletion() -> None:
     ("path", "normalized"),
     [
         ("readme.md", "readme.md"),
+        ("âñ/€uro.md", "âñ/€uro.md"),
         ('quo\\"tes', 'quo"tes'),
         ('"surrounded"', "surrounded"),
         ("m4\\303\\2424\\303\\2614a", "m4â4ñ4a"),
@@ -52,3 +61,27 @@ def test_temporary_directory_with_git_repo_deletion() -> None:
 )
 def test_normalizing_git_paths(path: str, normalized: str) -> None:
     assert normalize_git_path(path) == normalized
+
+
+@pytest.mark.parametrize(
+    "contents, expected",
+    [
+        (b"same contents", True),
+        (b"same content!", False),
+        (b"same content", False),
+        (b"same contents, longer", False),
+        (b"", False),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [4, 65536])
+@pytest.mark.parametrize("from_file", [False, True])
+def test_file_contents_equal(
+    tmp_path: Path, contents: bytes, expected: bool, chunk_size: int, from_file: bool
+) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"same contents")
+    expected_contents: bytes | Path = contents
+    if from_file:
+        expected_contents = tmp_path / "expected.bin"
+        expected_contents.write_bytes(contents)
+    assert file_contents_equal(path, expected_contents, chunk_size) is expected
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import platform
+from filecmp import dircmp
 from pathlib import Path
 from shutil import rmtree
 from textwrap import dedent
@@ -1188,6 +1190,13 @@ def test_update_needs_more_context(
         # Double quotes are not supported in file names on Windows.
         "qu`o'tes" if platform.system() == "Windows" else 'qu`o"tes',
         "m4â4ñ4a",
+        pytest.param(
+            "new\nline",
+            marks=pytest.mark.skipif(
+                platform.system() == "Windows",
+                reason="Newlines are not supported in file names on Windows.",
+            ),
+        ),
     ],
 )
 def test_conflicted_files_are_marked_unmerged(
@@ -1263,6 +1272,51 @@ def test_conflicted_files_are_marked_unmerged(
         )
 
 
+@pytest.mark.skipif(
+    platform.system() == "Windows" or os.geteuid() == 0,
+    reason="File permissions cannot make files unreadable here.",
+)
+def test_conflicted_files_with_unreadable_version(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+    build_file_tree(
+        {
+            (src / "readable.txt"): "upstream version 1",
+            (src / "unreadable.txt"): "upstream version 1",
+            (src / "{{_copier_conf.answers_file}}.jinja"): (
+                "{{_copier_answers|to_nice_yaml}}"
+            ),
+        }
+    )
+    with local.cwd(src):
+        git_init("hello template")
+        git("tag", "v1")
+    run_copy(str(src), dst, defaults=True, overwrite=True)
+    with local.cwd(dst):
+        git_init("hello project")
+        Path("readable.txt").write_text("upstream version 1 + downstream")
+        Path("unreadable.txt").write_text("upstream version 1 + downstream")
+        git("commit", "-am", "updated files")
+    with local.cwd(src):
+        Path("readable.txt").write_text("upstream version 2")
+        Path("unreadable.txt").write_text("upstream version 2")
+        git("commit", "-am", "change line in files")
+        git("tag", "v2")
+
+    def dircmp_unreadable(old_copy: str, new_copy: str) -> dircmp[str]:
+        # Break the new version once it is rendered and committed
+        Path(new_copy, "unreadable.txt").chmod(0)
+        return dircmp(old_copy, new_copy)
+
+    monkeypatch.setattr("copier.main.dircmp", dircmp_unreadable)
+    run_update(dst_path=dst, defaults=True, overwrite=True, conflict="inline")
+    assert "_commit: v2" in (dst / ".copier-answers.yml").read_text()
+    with local.cwd(dst):
+        lines = git("status", "--porcelain=v1").strip().splitlines()
+    assert "UU readable.txt" in lines
+
+
 def test_3way_merged_files_without_conflicts_are_not_marked_unmerged(
     tmp_path_factory: pytest.TempPathFactory,
 ) -> None:
@@ -1586,6 +1640,57 @@ def test_update_with_separate_git_directory(
     assert "_commit: v2" in (dst / ".copier-answers.yml").read_text()
 
 
+def test_update_workers_share_template(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src, dst = map(tmp_path_factory.mktemp, ("src", "dst"))
+    with local.cwd(src):
+        build_file_tree(
+            {
+                "removed.txt": "removed",
+                "version.txt": "v1",
+                "{{ _copier_conf.answers_file }}.jinja": "{{ _copier_answers|to_nice_yaml }}",
+            }
+        )
+        git_init("v1")
+        git("tag", "v1")
+    run_copy(str(src), dst, defaults=True, overwrite=True)
+    with local.cwd(dst):
+        git_init("v1")
+        Path("removed.txt").unlink()
+        git("commit", "-am", "remove file")
+    with local.cwd(src):
+        build_file_tree({"version.txt": "v2"})
+        git("commit", "-am", "v2")
+        git("tag", "v2")
+
+    shared: list[tuple[Worker, Worker]] = []
+    share_template = Worker._share_template
+
+    def spy(self: Worker, worker: Worker) -> None:
+        share_template(self, worker)
+        shared.append((self, worker))
+
+    monkeypatch.setattr(Worker, "_share_template", spy)
+    with Worker(
+        dst_path=dst, defaults=True, overwrite=True, exclude=["excluded.txt"]
+    ) as worker:
+        worker.run_update()
+    assert (dst / "version.txt").read_text() == "v2"
+    assert len(shared) == 3
+    assert all(parent is worker for parent, _ in shared)
+    old_worker, current_worker, new_worker = (sub for _, sub in shared)
+    # The old copy uses the previous commit, so it loads its own template
+    assert old_worker.template is not worker.template
+    assert current_worker.template is worker.template
+    assert new_worker.template is worker.template
+    assert current_worker.jinja_env is worker.jinja_env
+    # Excludes are still set for each worker
+    assert worker.exclude == ["excluded.txt"]
+    assert "removed.txt" in current_worker.exclude
+    assert "removed.txt" in new_worker.exclude
+
+
 def test_update_with_skip_answered_and_new_answer(
     tmp_path_factory: pytest.TempPathFactory,
 ) -> None:
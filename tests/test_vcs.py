@@ -64,6 +64,7 @@ def test_get_repo() -> None:
     assert (
         get("tests/demo_updatediff_repo.bundle") == "tests/demo_updatediff_repo.bundle"
     )
+    assert get("tests/demo") is None
 
 
 @pytest.mark.impure